@@ -1,10 +1,36 @@
 from datetime import datetime
 from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 from hyacinth.db.models import Listing
+from hyacinth.models import BaseListing
+
+
+def add_listings(
+    session: Session, search_spec_id: int, listings: Sequence[BaseListing]
+) -> datetime | None:
+    """
+    Insert listings for a search spec using a single multi-row INSERT.
+
+    Returns the time at which the listings were saved, or None if there were no listings to save.
+    """
+    if not listings:
+        return None
+
+    created_at = session.execute(
+        insert(Listing).returning(Listing.created_at),
+        [
+            {
+                "search_spec_id": search_spec_id,
+                "listing_json": listing.model_dump_json(),
+                "creation_time": listing.creation_time,
+            }
+            for listing in listings
+        ],
+    ).scalars()
+    return max(created_at)
 
 
 def get_listings(session: Session, search_spec_id: int, after_time: datetime) -> Sequence[Listing]:
@@ -18,12 +44,12 @@ def get_listings(session: Session, search_spec_id: int, after_time: datetime) ->
     return session.execute(stmt).scalars().all()
 
 
-def get_last_listing(session: Session, search_spec_id: int) -> Listing | None:
-    stmt = (
-        select(Listing)
-        .where(Listing.search_spec_id == search_spec_id)
-        .order_by(Listing.creation_time.desc())
-        .limit(1)
+def get_last_seen_times(session: Session) -> dict[int, datetime]:
+    """
+    Get the time at which the most recent listing was saved for each search spec, by search spec ID.
+    """
+    stmt = select(Listing.search_spec_id, func.max(Listing.created_at)).group_by(
+        Listing.search_spec_id
     )
 
-    return session.execute(stmt).scalars().first()
+    return {search_spec_id: created_at for search_spec_id, created_at in session.execute(stmt)}
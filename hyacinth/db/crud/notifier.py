@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Collection, Iterator
 
 import discord
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
 
-from hyacinth.db.models import ChannelNotifierState
+from hyacinth.db.models import ChannelNotifierState, Filter, NotifierSearch
 
 if TYPE_CHECKING:
     from hyacinth.monitor import SearchMonitor
@@ -26,8 +27,9 @@ def add_notifier_state(session: Session, notifier: ListingNotifier) -> ChannelNo
         channel_id=str(notifier.channel.id),
         notification_frequency_seconds=notifier.config.notification_frequency_seconds,
         paused=notifier.config.paused,
-        active_searches=list(notifier.config.active_searches),
-        filters=list(notifier.config.filters),
+        # relationship assignment copies into a new instrumented collection, no need to copy here
+        active_searches=notifier.config.active_searches,
+        filters=notifier.config.filters,
     )
     session.add(notifier_state)
     return notifier_state
@@ -42,47 +44,46 @@ def save_notifier_state(session: Session, notifier: ListingNotifier) -> None:
         raise ValueError("Cannot save notifier state with no ID")
 
     _logger.debug(f"Saving notifier state for channel {notifier.channel.id}")
-    notifier_state = (
-        session.query(ChannelNotifierState)
-        .filter(ChannelNotifierState.id == notifier.config.id)
-        .one()
+    home_latitude, home_longitude = notifier.config.home_location or (None, None)
+    stmt = (
+        update(ChannelNotifierState)
+        .where(ChannelNotifierState.id == notifier.config.id)
+        .values(
+            paused=notifier.config.paused,
+            notification_frequency_seconds=notifier.config.notification_frequency_seconds,
+            home_latitude=home_latitude,
+            home_longitude=home_longitude,
+        )
+        .returning(ChannelNotifierState.id)
     )
-
-    notifier_state.paused = notifier.config.paused
-    notifier_state.notification_frequency_seconds = notifier.config.notification_frequency_seconds
-    if notifier.config.home_location is not None:
-        notifier_state.home_latitude = notifier.config.home_location[0]
-        notifier_state.home_longitude = notifier.config.home_location[1]
-    else:
-        notifier_state.home_latitude = None
-        notifier_state.home_longitude = None
+    if session.execute(stmt).scalar_one_or_none() is None:
+        raise ValueError(f"No saved notifier state with ID {notifier.config.id}")
 
 
 def get_channel_notifiers(
     session: Session, client: discord.Client, monitor: SearchMonitor
-) -> list[ChannelNotifier]:
+) -> Iterator[ChannelNotifier]:
     """
     Get all saved ChannelNotifiers from the database.
 
-    If a stale notifier is encountered (for a channel that no longer exists), it is automatically
-    deleted from the database.
+    Notifiers are created as the returned iterator is consumed, so the session must stay open until
+    iteration is complete. Stale notifiers (for channels that no longer exist) are deleted from the
+    database before the first notifier is yielded.
     """
     from hyacinth.notifier import ChannelNotifier
 
-    saved_states: list[ChannelNotifierState] = session.query(ChannelNotifierState).all()
+    # resolve channels from a single prefetched lookup rather than a get_channel call per row
+    channel_lookup = {channel.id: channel for channel in client.get_all_channels()}
+    _delete_stale_notifier_states(session, channel_lookup.keys())
 
-    notifiers: list[ChannelNotifier] = []
-    stale_notifiers: list[ChannelNotifierState] = []
+    saved_states = session.execute(
+        select(ChannelNotifierState).execution_options(yield_per=128)
+    ).scalars()
     for notifier_state in saved_states:
-        notifier_channel = client.get_channel(int(notifier_state.channel_id))
-
-        # If the channel no longer exists, delete the notifier from the database.
+        notifier_channel = channel_lookup.get(int(notifier_state.channel_id))
         if notifier_channel is None:
-            _logger.info(f"Found stale notifier for channel {notifier_state.channel_id}! Deleting.")
-            stale_notifiers.append(notifier_state)
             continue
 
-        # Otherwise, create a new ChannelNotifier from the saved state.
         if notifier_state.home_latitude is not None and notifier_state.home_longitude is not None:
             home_location = (
                 notifier_state.home_latitude,
@@ -90,7 +91,7 @@ def get_channel_notifiers(
             )
         else:
             home_location = None
-        notifier = ChannelNotifier(
+        yield ChannelNotifier(
             # assume saved channel type is messageable
             notifier_channel,  # type: ignore[arg-type]
             monitor,
@@ -99,16 +100,32 @@ def get_channel_notifiers(
                 notification_frequency_seconds=notifier_state.notification_frequency_seconds,
                 paused=notifier_state.paused,
                 home_location=home_location,
+                # copy out of the instrumented collections, as the notifier mutates these lists
+                # after the state object is detached from the session
                 active_searches=list(notifier_state.active_searches),
                 filters=list(notifier_state.filters),
             ),
         )
-        notifiers.append(notifier)
 
-    if stale_notifiers:
-        _logger.info(f"Deleting {len(stale_notifiers)} stale notifiers from the database.")
-        for notifier_state in stale_notifiers:
-            session.delete(notifier_state)
-        session.commit()
 
-    return notifiers
+def _delete_stale_notifier_states(session: Session, channel_ids: Collection[int]) -> None:
+    """
+    Delete saved notifier states for channels that are not in channel_ids.
+    """
+    stale_ids: list[int] = []
+    for notifier_state_id, channel_id in session.execute(
+        select(ChannelNotifierState.id, ChannelNotifierState.channel_id)
+    ):
+        if int(channel_id) not in channel_ids:
+            _logger.info(f"Found stale notifier for channel {channel_id}! Deleting.")
+            stale_ids.append(notifier_state_id)
+
+    if not stale_ids:
+        return
+
+    _logger.info(f"Deleting {len(stale_ids)} stale notifiers from the database.")
+    # bulk deletes bypass ORM cascades, so related searches and filters are removed explicitly
+    session.execute(delete(NotifierSearch).where(NotifierSearch.notifier_id.in_(stale_ids)))
+    session.execute(delete(Filter).where(Filter.notifier_id.in_(stale_ids)))
+    session.execute(delete(ChannelNotifierState).where(ChannelNotifierState.id.in_(stale_ids)))
+    session.commit()
@@ -11,7 +11,7 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from hyacinth.enums import RuleType
 
 if TYPE_CHECKING:
-    from hyacinth.models import BaseListing, BaseSearchParams
+    from hyacinth.models import BaseSearchParams
     from hyacinth.plugin import Plugin
 
 
@@ -51,14 +51,6 @@ class Listing(Base):
 
     search_spec: Mapped[SearchSpec] = relationship("SearchSpec")
 
-    @classmethod
-    def from_base_listing(cls, base_listing: BaseListing, search_spec_id: int) -> Listing:
-        return cls(
-            search_spec_id=search_spec_id,
-            listing_json=base_listing.model_dump_json(),
-            creation_time=base_listing.creation_time,
-        )
-
 
 class SearchSpec(Base):
     """
@@ -173,6 +165,7 @@ class ChannelNotifierState(Base):
     __tablename__ = "channelnotifier"
 
     id: Mapped[int] = mapped_column(primary_key=True)
+    # the unique constraint is backed by an index, so lookups by channel do not scan the table
     channel_id: Mapped[str] = mapped_column(unique=True)
     notification_frequency_seconds: Mapped[int]
     paused: Mapped[bool] = mapped_column(default=False)
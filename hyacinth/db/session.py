@@ -10,7 +10,14 @@ credentials = f"{settings.postgres_user}:{settings.postgres_password}"
 host = f"db:5432/{settings.postgres_user}"
 connection_string = f"postgresql://{credentials}@{host}"
 
-engine = create_engine(f"postgresql://{credentials}@{host}", future=True)
+engine = create_engine(
+    f"postgresql://{credentials}@{host}",
+    future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_use_lifo=settings.db_pool_use_lifo,
+    pool_pre_ping=settings.db_pool_pre_ping,
+)
 Session = sessionmaker(engine)
 
 Base.metadata.create_all(engine)
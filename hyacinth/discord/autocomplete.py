@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Coroutine
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Type
 
 from discord import Interaction
 from discord.app_commands import Choice
 
 from hyacinth.db.models import Filter
 from hyacinth.discord.commands.configure import configurable_settings
+from hyacinth.models import BaseListing
 
 if TYPE_CHECKING:
     from hyacinth.discord.discord_bot import DiscordBot
@@ -36,6 +38,18 @@ def get_search_autocomplete(
     return search_autocomplete
 
 
+@cache
+def _get_alphabetical_filterable_fields(
+    listing_classes: frozenset[Type[BaseListing]],
+) -> tuple[str, ...]:
+    # listing models are static per process, so the sorted field names for a given set of
+    # plugins only need to be computed once rather than on every keystroke
+    filterable_fields: set[str] = set()
+    for listing_cls in listing_classes:
+        filterable_fields.update(listing_cls.model_fields.keys())
+    return tuple(sorted(filterable_fields))
+
+
 def get_filter_field_autocomplete(
     bot: DiscordBot,
 ) -> Callable[[Interaction, str], Coroutine[Any, Any, list[Choice[str]]]]:
@@ -48,10 +62,9 @@ def get_filter_field_autocomplete(
         channel_notifier = bot.notifiers[channel_id]
         channel_plugins = channel_notifier.get_active_plugins()
 
-        filterable_fields: set[str] = set()
-        for plugin in channel_plugins:
-            filterable_fields.update(plugin.listing_cls.model_fields.keys())
-        alphabetical_fields = sorted(filterable_fields)
+        alphabetical_fields = _get_alphabetical_filterable_fields(
+            frozenset(plugin.listing_cls for plugin in channel_plugins)
+        )
 
         return [
             Choice(name=field, value=field)
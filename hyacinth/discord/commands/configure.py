@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 _logger = logging.getLogger(__name__)
 configurable_settings = ["notification_frequency", "home_location"]
 
+_HOME_LOCATION_RE = re.compile(
+    r"^\s*\(?(?P<latitude>-?\d+(?:\.\d+)?)\s*[, ]\s*(?P<longitude>-?\d+(?:\.\d+)?)\s*\)?\s*$"
+)
+
 
 async def configure(
     bot: DiscordBot,
@@ -66,8 +70,7 @@ async def _set_home_location(
     interaction: discord.Interaction,
     value: str,
 ) -> None:
-    p = r"^\s*\(?(?P<latitude>-?\d+(?:\.\d+)?)\s*[, ]\s*(?P<longitude>-?\d+(?:\.\d+)?)\s*\)?\s*$"
-    match = re.match(p, value)
+    match = _HOME_LOCATION_RE.match(value)
 
     if match:
         latitude = float(match.group("latitude"))
@@ -44,18 +44,17 @@ async def _create_search_with_params(
         )
         return
 
-    created_notifier = False
-    if channel.id not in bot.notifiers:
+    notifier = bot.notifiers.get(channel.id)
+    created_notifier = notifier is None
+    if notifier is None:
         _logger.info(f"Creating search notification for channel {channel.id}")
-        bot.notifiers[channel.id] = ChannelNotifier(
-            channel, bot.monitor, ChannelNotifier.Config(paused=True)
-        )
+        notifier = ChannelNotifier(channel, bot.monitor, ChannelNotifier.Config(paused=True))
+        bot.notifiers[channel.id] = notifier
         # persist the new notifier to the database
         with Session() as session:
-            notifier_state = add_notifier_state(session, bot.notifiers[channel.id])
+            notifier_state = add_notifier_state(session, notifier)
             session.commit()
-            bot.notifiers[channel.id].config.id = notifier_state.id
-        created_notifier = True
+            notifier.config.id = notifier_state.id
 
     # if this is the first search set up on this channel, the notifier starts paused. add some
     # helpful information about that for the user if necessary.
@@ -68,7 +67,7 @@ async def _create_search_with_params(
 
     # create the search
     search_params_json = json.loads(search_params.json())  # dump and load to serialize subclasses
-    bot.notifiers[channel.id].create_search(name, plugin, search_params_json)
+    notifier.create_search(name, plugin, search_params_json)
 
     await interaction.response.send_message(
         (
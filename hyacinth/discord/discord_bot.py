@@ -4,6 +4,7 @@ import asyncio
 import logging
 import random
 from datetime import datetime
+from functools import cached_property
 
 import discord
 from discord import app_commands
@@ -17,11 +18,6 @@ from hyacinth.discord.autocomplete import (
     get_filter_field_autocomplete,
     get_search_autocomplete,
 )
-from hyacinth.discord.commands.configure import configure as configure_cmd
-from hyacinth.discord.commands.filter import create_filter, delete_filter, edit_filter
-from hyacinth.discord.commands.pause import pause as pause_cmd
-from hyacinth.discord.commands.search import create_search, delete_search, edit_search
-from hyacinth.discord.commands.show import show as show_cmd
 from hyacinth.enums import RuleType
 from hyacinth.metrics import start_metrics_write_task
 from hyacinth.monitor import SearchMonitor
@@ -34,8 +30,10 @@ from hyacinth.util.geo import get_local_geolocator
 settings = get_settings()
 _logger = logging.getLogger(__name__)
 
-AFFIRMATIONS = ["Okay", "Sure", "Sounds good", "No problem", "Roger that", "Got it"]
-THANKS = [*AFFIRMATIONS, "Thanks", "Thank you"]
+AFFIRMATIONS = ("Okay", "Sure", "Sounds good", "No problem", "Roger that", "Got it")
+THANKS = (*AFFIRMATIONS, "Thanks", "Thank you")
+_AFFIRMATIONS_LEN = len(AFFIRMATIONS)
+_THANKS_LEN = len(THANKS)
 
 
 class DiscordBot:
@@ -64,10 +62,9 @@ class DiscordBot:
 
     def load_saved_notifiers(self) -> None:
         with Session() as session:
-            notifiers = get_channel_notifiers(session, self.client, self.monitor)
-        for notifier in notifiers:
-            self.notifiers[notifier.channel.id] = notifier
-        _logger.info(f"Loaded {len(notifiers)} saved notifiers from the database!")
+            for notifier in get_channel_notifiers(session, self.client, self.monitor):
+                self.notifiers[notifier.channel.id] = notifier
+        _logger.info(f"Loaded {len(self.notifiers)} saved notifiers from the database!")
 
     async def register_commands(self) -> None:
         self.tree.add_command(self.search_command_group)
@@ -76,19 +73,23 @@ class DiscordBot:
         self.tree.add_command(self.show_command)
         self.tree.add_command(self.configure_command)
 
-        for guild in self.client.guilds:
-            _logger.info(f"Adding commands to guild {guild.name}")
-            self.tree.copy_global_to(guild=guild)  # type: ignore
-            await self.tree.sync(guild=guild)  # type: ignore
+        # each guild sync is a separate HTTP request, so run them concurrently
+        await asyncio.gather(*(self._sync_guild(guild) for guild in self.client.guilds))
+
+    async def _sync_guild(self, guild: discord.Guild) -> None:
+        _logger.info(f"Adding commands to guild {guild.name}")
+        self.tree.copy_global_to(guild=guild)  # type: ignore
+        await self.tree.sync(guild=guild)  # type: ignore
 
     def affirm(self) -> str:
-        return random.choice(AFFIRMATIONS)
+        return AFFIRMATIONS[random.randrange(_AFFIRMATIONS_LEN)]
 
     def thank(self) -> str:
-        return random.choice(THANKS)
+        return THANKS[random.randrange(_THANKS_LEN)]
 
-    @property
+    @cached_property
     def search_command_group(self) -> app_commands.Group:
+        # built once, so plugins must be loaded before first access to populate the plugin choices
         @app_commands.command(description="Add a new search to this channel.")  # type: ignore
         @app_commands.describe(
             plugin="The plugin to use for this search.",
@@ -104,6 +105,8 @@ class DiscordBot:
         )
         @log_exceptions(_logger)
         async def add(interaction: discord.Interaction, plugin: int, name: str) -> None:
+            from hyacinth.discord.commands.search import create_search
+
             await create_search(self, interaction, self.plugins[plugin], name)
 
         @app_commands.command(  # type: ignore
@@ -113,6 +116,8 @@ class DiscordBot:
         @app_commands.autocomplete(search=get_search_autocomplete(self))
         @log_exceptions(_logger)
         async def edit(interaction: discord.Interaction, search: str) -> None:
+            from hyacinth.discord.commands.search import edit_search
+
             await edit_search(self, interaction, search)
 
         @app_commands.command(  # type: ignore
@@ -122,6 +127,8 @@ class DiscordBot:
         @app_commands.autocomplete(search=get_search_autocomplete(self))
         @log_exceptions(_logger)
         async def delete(interaction: discord.Interaction, search: str) -> None:
+            from hyacinth.discord.commands.search import delete_search
+
             await delete_search(self, interaction, search)
 
         search_command_group = app_commands.Group(
@@ -133,7 +140,7 @@ class DiscordBot:
 
         return search_command_group
 
-    @property
+    @cached_property
     def filter_command_group(self) -> app_commands.Group:
         @app_commands.command(  # type: ignore
             name="add", description="Add a new filter rule for notifications on this channel."
@@ -153,6 +160,8 @@ class DiscordBot:
         async def add(
             interaction: discord.Interaction, field: str, rule_type: str, rule: str
         ) -> None:
+            from hyacinth.discord.commands.filter import create_filter
+
             await create_filter(self, interaction, field, RuleType(rule_type), rule)
 
         @app_commands.command(  # type: ignore
@@ -166,6 +175,8 @@ class DiscordBot:
         @app_commands.autocomplete(filter=get_filter_autocomplete(self))
         @log_exceptions(_logger)
         async def edit(interaction: discord.Interaction, filter: int, new_rule: str) -> None:
+            from hyacinth.discord.commands.filter import edit_filter
+
             await edit_filter(self, interaction, filter, new_rule)
 
         @app_commands.command(  # type: ignore
@@ -178,6 +189,8 @@ class DiscordBot:
         @app_commands.autocomplete(filter=get_filter_autocomplete(self))
         @log_exceptions(_logger)
         async def delete(interaction: discord.Interaction, filter: int) -> None:
+            from hyacinth.discord.commands.filter import delete_filter
+
             await delete_filter(self, interaction, filter)
 
         filter_command_group = app_commands.Group(
@@ -189,29 +202,33 @@ class DiscordBot:
 
         return filter_command_group
 
-    @property
+    @cached_property
     def pause_command(self) -> app_commands.Command:
         @app_commands.command(  # type: ignore
             description="Temporarily pause or resume notifications on this channel."
         )
         @log_exceptions(_logger)
         async def pause(interaction: discord.Interaction) -> None:
+            from hyacinth.discord.commands.pause import pause as pause_cmd
+
             await pause_cmd(self, interaction)
 
         return pause
 
-    @property
+    @cached_property
     def show_command(self) -> app_commands.Command:
         @app_commands.command(  # type: ignore
             description="Show a summary of existing notifiers and filter rules for this channel."
         )
         @log_exceptions(_logger)
         async def show(interaction: discord.Interaction) -> None:
+            from hyacinth.discord.commands.show import show as show_cmd
+
             await show_cmd(self, interaction)
 
         return show
 
-    @property
+    @cached_property
     def configure_command(self) -> app_commands.Command:
         @app_commands.command(  # type: ignore
             description="Change notification setttings for this channel."
@@ -223,6 +240,8 @@ class DiscordBot:
         @app_commands.autocomplete(setting=get_configure_autocomplete(self))
         @log_exceptions(_logger)
         async def configure(interaction: discord.Interaction, setting: str, value: str) -> None:
+            from hyacinth.discord.commands.configure import configure as configure_cmd
+
             await configure_cmd(self, interaction, setting, value)
 
         return configure
@@ -250,4 +269,9 @@ async def start() -> None:
     if settings.use_local_geocoder:
         get_local_geolocator()
 
-    await client.start(settings.discord_token)
+    try:
+        await client.start(settings.discord_token)
+    finally:
+        from hyacinth.util.scraping import close_browser_context
+
+        await close_browser_context()
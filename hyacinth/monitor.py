@@ -1,12 +1,14 @@
 import logging
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Sequence
 
 from apscheduler.job import Job
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.triggers.interval import IntervalTrigger
-from zoneinfo import ZoneInfo
 
-from hyacinth.db.crud.listing import get_last_listing as get_last_listing_from_db
+from hyacinth.db.crud.listing import add_listings
+from hyacinth.db.crud.listing import get_last_seen_times as get_last_seen_times_from_db
 from hyacinth.db.crud.listing import get_listings as get_listings_from_db
 from hyacinth.db.models import Listing, SearchSpec
 from hyacinth.db.session import Session
@@ -19,24 +21,47 @@ from hyacinth.util.crash_report import save_poll_failure_report
 settings = get_settings()
 _logger = logging.getLogger(__name__)
 
+BACKDATE_TIME = timedelta(hours=settings.notifier_backdate_time_hours)
+
+
+@dataclass
+class _SearchJobState:
+    # None if search polling is disabled
+    job: Job | None
+    # number of notifiers watching this search
+    ref_count: int = 1
+    # after time -> listings. notifiers watching the same search usually query with the same after
+    # time, so this lets them share one query. listings for a search only change when it is polled,
+    # so the cache is reset whenever new listings are saved.
+    listings_cache: dict[datetime, Sequence[Listing]] = field(default_factory=dict)
+
 
 class SearchMonitor:
     def __init__(self) -> None:
         self.scheduler = get_async_scheduler()
         self.search_specs: list[SearchSpec] = []
-        self.search_spec_job_mapping: dict[int, Job] = {}  # SearchSpec id -> job
-        self.search_spec_ref_count: dict[int, int] = {}  # SearchSpec id -> ref count
+        self.search_jobs: dict[int, _SearchJobState] = {}  # SearchSpec id -> job state
+
+        # SearchSpec id -> time the most recent listing was saved. loaded once here and kept up to
+        # date by poll_search, so polls do not need to query for the last listing.
+        with Session() as session:
+            self._last_seen: dict[int, datetime] = get_last_seen_times_from_db(session)
 
     def register_search(self, search_spec: SearchSpec) -> None:
-        # check if there is already a scheduled task to poll this search
-        if search_spec.id in self.search_spec_job_mapping:
+        # check if this search is already being monitored
+        if (search_job := self.search_jobs.get(search_spec.id)) is not None:
             _logger.info("Search already exists, not registering new search")
-            self.search_spec_ref_count[search_spec.id] += 1
+            search_job.ref_count += 1
+            return
+
+        if settings.disable_search_polling:
+            _logger.debug(f"Search polling is disabled, not scheduling job for {search_spec}")
+            self.search_jobs[search_spec.id] = _SearchJobState(job=None)
             return
 
         # otherwise schedule a job to periodically check results and write them to the db
         _logger.info(f"Scheduling job for new search! {search_spec}")
-        self.search_spec_job_mapping[search_spec.id] = self.scheduler.add_job(
+        job = self.scheduler.add_job(
             self.poll_search,
             kwargs={"search_spec": search_spec},
             trigger=IntervalTrigger(
@@ -44,47 +69,49 @@ class SearchMonitor:
             ),
             next_run_time=datetime.now(),
         )
-        self.search_spec_ref_count[search_spec.id] = 1
+        self.search_jobs[search_spec.id] = _SearchJobState(job=job)
 
     def remove_search(self, search_spec: SearchSpec) -> None:
-        self.search_spec_ref_count[search_spec.id] -= 1
-        if self.search_spec_ref_count[search_spec.id] == 0:
+        search_job = self.search_jobs[search_spec.id]
+        search_job.ref_count -= 1
+        if search_job.ref_count == 0:
             # there are no more notifiers looking at this search, remove the monitoring job
             _logger.debug(f"Removing search from monitor {search_spec}")
-            job = self.search_spec_job_mapping[search_spec.id]
-            self.scheduler.remove_job(job.id)
-            del self.search_spec_job_mapping[search_spec.id]
-            del self.search_spec_ref_count[search_spec.id]
+            if search_job.job is not None:
+                self.scheduler.remove_job(search_job.job.id)
+            del self.search_jobs[search_spec.id]
 
     async def get_listings(
         self, search_spec: SearchSpec, after_time: datetime
     ) -> Sequence[Listing]:
+        search_job = self.search_jobs.get(search_spec.id)
+        if search_job is not None and after_time in search_job.listings_cache:
+            return search_job.listings_cache[after_time]
+
         with Session() as session:
-            return get_listings_from_db(session, search_spec.id, after_time)
+            listings = get_listings_from_db(session, search_spec.id, after_time)
+        if search_job is not None:
+            search_job.listings_cache[after_time] = listings
+        return listings
 
     async def poll_search(self, search_spec: SearchSpec) -> None:
-        if settings.disable_search_polling:
-            _logger.debug(f"Search polling is disabled, would poll search {search_spec}")
-            return
-
+        after_time = datetime.now(timezone.utc) - BACKDATE_TIME
+        last_seen = self._last_seen.get(search_spec.id)
+        if last_seen is not None:
+            # resume at the last listing time if it was more recent than the backdate time
+            after_time = max(last_seen, after_time)
+            _logger.debug(f"Found recent listing at {last_seen}, resuming at {after_time}.")
+
+        listings = await self.__safe_poll_search(search_spec, after_time)
         with Session() as session:
-            after_time = datetime.utcnow().replace(tzinfo=ZoneInfo("UTC")) - timedelta(
-                hours=settings.notifier_backdate_time_hours
-            )
-            last_listing = get_last_listing_from_db(session, search_spec.id)
-            if last_listing is not None:
-                # resume at the last listing time if it was more recent than the backdate time
-                after_time = max(last_listing.created_at, after_time)
-                _logger.debug(
-                    f"Found recent listing at {last_listing.created_at}, resuming at {after_time}."
-                )
-
-            listings = await self.__safe_poll_search(search_spec, after_time)
-            session.add_all(
-                Listing.from_base_listing(listing, search_spec.id) for listing in listings
-            )
+            saved_at = add_listings(session, search_spec.id, listings)
             session.commit()
-            _logger.debug(f"Found {len(listings)} since {after_time} for search_spec={search_spec}")
+
+        if saved_at is not None:
+            self._last_seen[search_spec.id] = max(saved_at, last_seen or saved_at)
+            if (search_job := self.search_jobs.get(search_spec.id)) is not None:
+                search_job.listings_cache.clear()
+        _logger.debug(f"Found {len(listings)} since {after_time} for search_spec={search_spec}")
 
     async def __safe_poll_search(
         self, search_spec: SearchSpec, after_time: datetime
@@ -105,6 +132,13 @@ class SearchMonitor:
         write_metric(METRIC_POLL_JOB_EXECUTION_COUNT, 1, labels)
 
     def __del__(self) -> None:
-        for search_spec in self.search_spec_job_mapping:
-            job = self.search_spec_job_mapping[search_spec]
-            self.scheduler.remove_job(job.id)
+        # the scheduler is shared with the notifiers, so only this monitor's own jobs are removed
+        # rather than calling remove_all_jobs
+        for search_job in self.search_jobs.values():
+            if search_job.job is None:
+                continue
+            try:
+                self.scheduler.remove_job(search_job.job.id)
+            except JobLookupError:
+                pass  # job already removed, e.g. if the scheduler was shut down first
+        self.search_jobs.clear()
@@ -5,11 +5,10 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 from apscheduler.triggers.interval import IntervalTrigger
-from zoneinfo import ZoneInfo
 
 from hyacinth import filters
 from hyacinth.db.crud.filter import add_filter
@@ -20,7 +19,7 @@ from hyacinth.db.models import Filter, Listing, NotifierSearch
 from hyacinth.db.session import Session
 from hyacinth.enums import RuleType
 from hyacinth.models import ListingMetadata
-from hyacinth.monitor import SearchMonitor
+from hyacinth.monitor import BACKDATE_TIME, SearchMonitor
 from hyacinth.plugin import Plugin
 from hyacinth.scheduler import get_async_scheduler
 from hyacinth.settings import get_settings
@@ -74,9 +73,7 @@ class ListingNotifier(ABC):
         last_notified: datetime | None = None,
     ) -> None:
         if last_notified is None:
-            last_notified = datetime.utcnow().replace(tzinfo=ZoneInfo("UTC")) - timedelta(
-                hours=settings.notifier_backdate_time_hours
-            )
+            last_notified = datetime.now(timezone.utc) - BACKDATE_TIME
 
         with Session(expire_on_commit=False) as session:
             search_spec = add_search_spec(session, plugin.path, search_params_json)
@@ -41,6 +41,13 @@ class Settings(BaseSettings):
     postgres_user: str = Field(alias="POSTGRES_USER")
     postgres_password: str = Field(alias="POSTGRES_PASSWORD")
 
+    # db connection pool
+    # LIFO reuses the most recently returned connection, letting idle overflow connections time out
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_use_lifo: bool = True
+    db_pool_pre_ping: bool = True
+
     # the local geocoding implementation does not require a google API key, but requires first
     # downloading some spatial data and only supports the US
     use_local_geocoder: bool = True
@@ -66,6 +73,8 @@ class Settings(BaseSettings):
     # requires s3 credentials
     enable_s3_thumbnail_mirroring: bool = False
     s3_image_mirror_expiration_days: int = 1
+    # number of thumbnails to mirror at once while enriching a batch of listings
+    s3_thumbnail_mirror_concurrency: int = 4
     s3_url: str | None = None
     s3_access_key: str | None = None
     s3_secret_key: str | None = None
@@ -73,6 +82,10 @@ class Settings(BaseSettings):
 
     # sources are scraped using browserless, a headless browser, to avoid bot detection
     browserless_url: str = "http://browserless:3000"
+    # must be shorter than browserless' CONNECTION_TIMEOUT in docker-compose.yml
+    browser_connection_max_age_seconds: int = 50 * 60
+    # number of listing detail pages to fetch at once while scraping a page of search results
+    craigslist_detail_page_concurrency: int = 8
 
     # Development setings
     disable_search_polling: bool = False
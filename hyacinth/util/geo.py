@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from functools import cache
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -21,6 +21,9 @@ _logger = logging.getLogger(__name__)
 GADM_USA_GPKG_PATH = Path("geography/gadm36_USA.gpkg")
 GEONAMES_CITIES_PATH = Path("geography/cities1000.txt")
 
+# reverse geotag lookups are cached on coordinates rounded to this many decimal places (~110m)
+REVERSE_GEOTAG_CACHE_PRECISION = 3
+
 
 @cache
 def get_google_geolocator() -> GoogleV3:
@@ -37,9 +40,19 @@ def distance_miles(from_location: tuple[float, float], to_location: tuple[float,
 
 
 def reverse_geotag(geotag: tuple[float, float]) -> Location:
+    # many listings are posted from the same few neighborhoods, so nearby lookups share a result
+    location = _reverse_geotag_cached(
+        round(geotag[0], REVERSE_GEOTAG_CACHE_PRECISION),
+        round(geotag[1], REVERSE_GEOTAG_CACHE_PRECISION),
+    )
+    return location.model_copy(update={"latitude": geotag[0], "longitude": geotag[1]})
+
+
+@lru_cache(maxsize=8192)
+def _reverse_geotag_cached(latitude: float, longitude: float) -> Location:
     if settings.use_local_geocoder:
-        return _reverse_geotag_local(geotag)
-    return _reverse_geotag_google(geotag)
+        return _reverse_geotag_local((latitude, longitude))
+    return _reverse_geotag_google((latitude, longitude))
 
 
 def _reverse_geotag_google(geotag: tuple[float, float]) -> Location:
@@ -1,10 +1,14 @@
+import asyncio
 import logging
+import time
 import typing
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Literal
 from urllib.parse import urlparse
 
-from playwright.async_api import BrowserContext, Page, async_playwright
+from playwright.async_api import Browser, BrowserContext
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Page, Playwright, async_playwright
 
 from hyacinth.metrics import METRIC_SCRAPE_COUNT, write_metric
 from hyacinth.settings import get_settings
@@ -14,19 +18,108 @@ settings = get_settings()
 _logger = logging.getLogger(__name__)
 
 
+# a single browser connection is shared by all scrapes, as connecting to the browser is slow relative
+# to creating a context. browserless drops connections once they reach its CONNECTION_TIMEOUT, so a
+# connection is only handed out until it reaches browser_connection_max_age_seconds, then closed
+# once the searches still using it finish.
+_playwright: Playwright | None = None
+_browser: Browser | None = None
+_browser_connected_at = 0.0
+_browser_users: dict[Browser, int] = {}
+_browser_lock = asyncio.Lock()
+
+
 @asynccontextmanager
 async def get_browser_context() -> AsyncIterator[BrowserContext]:
-    async with async_playwright() as playwright:
-        browser = await playwright.chromium.connect_over_cdp(
-            "ws://browserless:3000?stealth&blockAds=true"
-        )
+    """
+    Get a new browser context on the shared browser connection, connecting if not already connected.
+
+    Each caller gets its own context, so cookies and storage don't carry over between searches. The
+    context is closed on exit, along with any pages still open in it.
+    """
+    browser = await _acquire_browser()
+    try:
         context = await browser.new_context()
         _patch_new_page(context)
-
         try:
             yield context
         finally:
-            await context.close()
+            try:
+                await context.close()
+            except PlaywrightError:
+                _logger.debug("Error closing browser context", exc_info=True)
+    finally:
+        await _release_browser(browser)
+
+
+async def close_browser_context() -> None:
+    """
+    Close the shared browser connection, e.g. on shutdown.
+    """
+    global _playwright, _browser
+    async with _browser_lock:
+        browsers = set(_browser_users)
+        if _browser is not None:
+            browsers.add(_browser)
+        for browser in browsers:
+            await _close_browser(browser)
+        _browser = None
+        _browser_users.clear()
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+
+async def _acquire_browser() -> Browser:
+    global _playwright, _browser, _browser_connected_at
+    async with _browser_lock:
+        if (
+            _browser is None
+            or not _browser.is_connected()
+            or time.monotonic() - _browser_connected_at
+            > settings.browser_connection_max_age_seconds
+        ):
+            # not connected yet, the connection was dropped, e.g. if the browser restarted, or the
+            # connection is close to being dropped by browserless
+            await _retire_browser()
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _logger.info("Connecting to browser")
+            _browser = await _playwright.chromium.connect_over_cdp(
+                "ws://browserless:3000?stealth&blockAds=true"
+            )
+            _browser_connected_at = time.monotonic()
+
+        _browser_users[_browser] = _browser_users.get(_browser, 0) + 1
+        return _browser
+
+
+async def _release_browser(browser: Browser) -> None:
+    async with _browser_lock:
+        if browser not in _browser_users:
+            return  # already closed on shutdown
+        _browser_users[browser] -= 1
+        if _browser_users[browser] == 0:
+            del _browser_users[browser]
+            if browser is not _browser:
+                await _close_browser(browser)
+
+
+async def _retire_browser() -> None:
+    """
+    Stop handing out the current browser connection, closing it if no searches are using it.
+    """
+    global _browser
+    if _browser is not None and _browser not in _browser_users:
+        await _close_browser(_browser)
+    _browser = None
+
+
+async def _close_browser(browser: Browser) -> None:
+    try:
+        await browser.close()
+    except PlaywrightError:
+        _logger.debug("Error closing browser, connection was likely already closed", exc_info=True)
 
 
 def _patch_new_page(context: BrowserContext) -> None:
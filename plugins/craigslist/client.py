@@ -1,16 +1,18 @@
+import asyncio
 import logging
-import re
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import AsyncGenerator
 
-from bs4 import BeautifulSoup
-from playwright.async_api import Page
-from zoneinfo import ZoneInfo
+import lxml.etree
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import BrowserContext, Page, TimeoutError
 
 from hyacinth.exceptions import ParseError
 from hyacinth.settings import get_settings
 from hyacinth.util.geo import reverse_geotag
 from hyacinth.util.s3 import mirror_image
+from hyacinth.util.save_pages import save_scraped_page
 from hyacinth.util.scraping import get_browser_context
 from plugins.craigslist.models import CraigslistListing, CraigslistSearchParams
 from plugins.craigslist.util import get_geotag_from_url
@@ -20,10 +22,35 @@ _logger = logging.getLogger(__name__)
 
 
 CRAIGSLIST_DATE_FORMAT = "%Y-%m-%d %H:%M"
-CRAIGSLIST_SEARCH_URL = "https://{site}.craigslist.org/search/{category}#search=1~gallery~{page}~0"
+# the page number and "~0" are appended to get the url of a single page of search results
+CRAIGSLIST_SEARCH_URL_PREFIX = "https://{site}.craigslist.org/search/{category}#search=1~gallery~"
 
 METRIC_CRAIGSLIST_PARSE_ERROR_COUNT = "craigslist_parse_error_count"
 
+# settings don't change after start-up, so this is read once rather than for every listing
+_MIRROR_THUMBNAILS = settings.enable_s3_thumbnail_mirroring
+
+# search results or the "no results" message have rendered
+_SEARCH_RESULTS_RENDERED_SELECTOR = ".cl-results-page li, .no-results:visible"
+# all listing details are inside section.body, so only that is sent back from the browser and
+# parsed, rather than the whole page
+_LISTING_BODY_SELECTOR = "section.body"
+_LISTING_BODY_STRAINER = SoupStrainer("section", attrs={"class": "body"})
+_OUTER_HTML_JS = "element => element.outerHTML"
+
+
+# search results only need a handful of values, so they are queried with precompiled xpaths rather
+# than by building a full BeautifulSoup tree. class matching mirrors CSS class selectors.
+_RESULTS_PAGE_XPATH = lxml.etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' cl-results-page ')]"
+)
+_LISTING_URLS_XPATH = lxml.etree.XPath(
+    ".//a[contains(concat(' ', normalize-space(@class), ' '), ' main ')]/@href"
+)
+_PAGE_NUMBER_XPATH = lxml.etree.XPath(
+    "string(//span[contains(concat(' ', normalize-space(@class), ' '), ' cl-page-number ')])"
+)
+
 
 async def get_listings(
     search_params: CraigslistSearchParams, after_time: datetime, limit: int | None = None
@@ -44,6 +71,9 @@ async def get_listings(
             await search.aclose()
             break
 
+    # enrichment mirrors thumbnails and may call a paid geocoding API, so it only runs for the
+    # listings that are kept
+    await _enrich_listings(listings)
     return listings
 
 
@@ -51,40 +81,84 @@ async def _search(
     search_params: CraigslistSearchParams,
 ) -> AsyncGenerator[CraigslistListing, None]:
     page = 0
+    search_url_prefix = CRAIGSLIST_SEARCH_URL_PREFIX.format(
+        site=search_params.site, category=search_params.category
+    )
     async with get_browser_context() as browser_context:
         browser_page = await browser_context.new_page()
+        detail_page_pool = await _new_page_pool(
+            browser_context, settings.craigslist_detail_page_concurrency
+        )
+        # most polls stop at the first listing, as it is older than the last one seen, so the rest
+        # of the listings are only fetched once the caller has asked for a second one
+        fetch_ahead = False
+
         while True:
-            search_results_content = await _get_search_results_content(
-                browser_page, site=search_params.site, category=search_params.category, page=page
+            has_next_page, parsed_search_results = await _get_search_results(
+                browser_page, f"{search_url_prefix}{page}~0"
             )
-            has_next_page, parsed_search_results = _parse_search_results(search_results_content)
 
-            for result_url in parsed_search_results:
-                detail_content = await _get_detail_content(browser_page, result_url)
-                listing = _parse_result_details(result_url, detail_content)
-                await _enrich_listing(listing)
-                yield listing
+            # fetch details concurrently, but yield listings in search result order so callers can
+            # stop at the first listing older than they are interested in
+            detail_tasks: list[asyncio.Task[CraigslistListing]] = []
+            try:
+                for i, result_url in enumerate(parsed_search_results):
+                    if i == len(detail_tasks):
+                        result_urls = parsed_search_results[i:] if fetch_ahead else [result_url]
+                        detail_tasks.extend(
+                            asyncio.create_task(_fetch_result_details(detail_page_pool, url))
+                            for url in result_urls
+                        )
+                    yield await detail_tasks[i]
+                    fetch_ahead = True
+            finally:
+                # stop any outstanding fetches if the caller stopped consuming listings early
+                for detail_task in detail_tasks:
+                    detail_task.cancel()
+                await asyncio.gather(*detail_tasks, return_exceptions=True)
 
             if not has_next_page:
                 break
-
             page += 1
 
 
-async def _get_search_results_content(
-    browser_page: Page, site: str, category: str, page: int
-) -> str:
+async def _get_search_results(
+    browser_page: Page, search_results_url: str
+) -> tuple[bool, list[str]]:
+    search_results_content = await _get_search_results_content(browser_page, search_results_url)
+    return _parse_search_results(search_results_content)
+
+
+async def _new_page_pool(browser_context: BrowserContext, size: int) -> asyncio.Queue[Page]:
+    """
+    Create a pool of browser pages. Pages are checked out with get() and returned with put_nowait().
+    """
+    pool: asyncio.Queue[Page] = asyncio.Queue()
+    for _ in range(size):
+        pool.put_nowait(await browser_context.new_page())
+    return pool
+
+
+async def _fetch_result_details(page_pool: asyncio.Queue[Page], url: str) -> CraigslistListing:
+    browser_page = await page_pool.get()
+    try:
+        detail_content = await _get_detail_content(browser_page, url)
+    finally:
+        page_pool.put_nowait(browser_page)
+
+    return _parse_result_details(url, detail_content)
+
+
+async def _get_search_results_content(browser_page: Page, search_results_url: str) -> str:
     """
     Get the content of a Craigslist search results page.
     """
-    search_results_url = CRAIGSLIST_SEARCH_URL.format(site=site, category=category, page=page)
     await browser_page.goto(search_results_url)
     try:
         _logger.debug("Waiting for search results to render")
-        await browser_page.wait_for_function(
-            # wait for search results or "no results" message to render
-            """() => document.querySelector('.cl-results-page')?.querySelector('li')
-                || document.querySelector('.no-results').offsetParent !== null""",
+        await browser_page.wait_for_selector(
+            _SEARCH_RESULTS_RENDERED_SELECTOR,
+            state="attached",
             timeout=5000,  # 5s
         )
     except TimeoutError:
@@ -102,21 +176,58 @@ async def _get_detail_content(browser_page: Page, url: str) -> str:
     """
     await browser_page.goto(url)
     _logger.debug("Waiting for listing details to render")
-    await browser_page.wait_for_selector("section.body")
-    _logger.debug("Getting listing details page content")
-    return await browser_page.content()
-
-
-async def _enrich_listing(listing: CraigslistListing) -> None:
+    try:
+        listing_body = await browser_page.wait_for_selector(
+            _LISTING_BODY_SELECTOR, timeout=10000
+        )  # 10s
+    except TimeoutError:
+        raise ParseError(
+            "Timed out waiting for listing details to render", await browser_page.content()
+        )
+    if listing_body is None:
+        raise ParseError("Couldn't find listing body!", await browser_page.content())
+
+    _logger.debug("Getting listing details content")
+    detail_content: str = await listing_body.evaluate(_OUTER_HTML_JS)
+    if settings.save_scraped_pages:
+        save_scraped_page(url, detail_content)
+    return detail_content
+
+
+async def _enrich_listings(listings: list[CraigslistListing]) -> None:
+    mirror_semaphore = asyncio.Semaphore(settings.s3_thumbnail_mirror_concurrency)
+    await asyncio.gather(
+        _reverse_geotag_listings(listings),
+        *(
+            _mirror_thumbnail(listing, listing.thumbnail_url, mirror_semaphore)
+            for listing in listings
+            if _MIRROR_THUMBNAILS and listing.thumbnail_url
+        ),
+    )
+
+
+async def _reverse_geotag_listings(listings: list[CraigslistListing]) -> None:
+    geotags = [_get_geotag(listing) for listing in listings]
+    # reverse geotagging blocks, so it runs in a thread while thumbnails are mirrored. geotags are
+    # looked up one at a time so nearby listings are served from the cache, rather than all missing
+    # it at once and each paying for a lookup
+    locations = await asyncio.to_thread(lambda: [reverse_geotag(geotag) for geotag in geotags])
+    for listing, location in zip(listings, locations):
+        listing.city = location.city
+        listing.state = location.state
+
+
+def _get_geotag(listing: CraigslistListing) -> tuple[float, float]:
     if not listing.latitude or not listing.longitude:
         listing.latitude, listing.longitude = get_geotag_from_url(listing.url)
+    return listing.latitude, listing.longitude
 
-    location = reverse_geotag((listing.latitude, listing.longitude))
-    listing.city = location.city
-    listing.state = location.state
 
-    if listing.thumbnail_url and settings.enable_s3_thumbnail_mirroring:
-        listing.thumbnail_url = await mirror_image(listing.thumbnail_url)
+async def _mirror_thumbnail(
+    listing: CraigslistListing, thumbnail_url: str, semaphore: asyncio.Semaphore
+) -> None:
+    async with semaphore:
+        listing.thumbnail_url = await mirror_image(thumbnail_url)
 
 
 def _parse_search_results(content: str) -> tuple[bool, list[str]]:
@@ -124,20 +235,22 @@ def _parse_search_results(content: str) -> tuple[bool, list[str]]:
     Parse Craigslist search results page and return a list of listing urls.
     """
     try:
-        soup = BeautifulSoup(content, "html.parser")
+        tree = lxml.html.fromstring(content)
 
-        cl_results_page = soup.find("div", class_="cl-results-page")
-        if not cl_results_page:
+        cl_results_pages = _RESULTS_PAGE_XPATH(tree)
+        if not cl_results_pages:
             raise ParseError("Couldn't find cl_results_page!", content)
-        listing_links = cl_results_page.find_all("a", class_="main", attrs={"href": True})  # type: ignore
-        listing_urls = [a.attrs["href"] for a in listing_links]
+        listing_urls = [str(href) for href in _LISTING_URLS_XPATH(cl_results_pages[0])]
 
         if len(listing_urls) == 0:
             # no results
             has_next_page = False
         else:
-            page_number = soup.find("span", class_="cl-page-number")
-            num_results = re.findall(r"\b(\d+)\b", page_number.text)  # type: ignore
+            page_number = _PAGE_NUMBER_XPATH(tree)
+            # page number text looks like "1 - 120 of 3,500", or "1 - 120 of >10,000"
+            page_number_text = page_number.replace(",", "").replace("-", " ")
+            num_results = [token.lstrip(">") for token in page_number_text.split()]
+            num_results = [token for token in num_results if token.isdigit()]
             has_next_page = num_results[1] != num_results[2]
 
         return has_next_page, listing_urls
@@ -152,46 +265,50 @@ def _parse_result_details(url: str, content: str) -> CraigslistListing:
     Parse Craigslist result details page.
     """
     try:
-        soup = BeautifulSoup(content, "html.parser")
+        soup = BeautifulSoup(content, "lxml", parse_only=_LISTING_BODY_STRAINER)
 
         # basic info
-        title = soup.find("span", id="titletextonly").text.strip()  # type: ignore
-        postingbody = soup.find("section", id="postingbody")
-        postingbody.find("div", class_="print-information").decompose()  # type: ignore
+        title = soup.select_one("span#titletextonly").text.strip()  # type: ignore
+        postingbody = soup.select_one("section#postingbody")
+        postingbody.select_one("div.print-information").decompose()  # type: ignore
         body = "\n".join(postingbody.stripped_strings)  # type: ignore
 
         # images
-        thumbs_container = soup.find(id="thumbs")
-        gallery = soup.find(class_="gallery")
+        thumbs_container = soup.select_one("#thumbs")
+        gallery = soup.select_one(".gallery")
         if thumbs_container:  # multiple images are present
-            image_urls = [
-                a.attrs["href"]
-                for a in thumbs_container.find_all("a", attrs={"href": True})  # type: ignore
-            ]
+            image_urls = [a["href"] for a in thumbs_container.select("a[href]")]  # type: ignore
         elif gallery:  # only a single image
-            image_urls = [gallery.find("img", attrs={"src": True}).attrs["src"]]  # type: ignore
+            image_urls = [gallery.select_one("img[src]")["src"]]  # type: ignore
         else:  # no images
             image_urls = []
 
         # price
-        price_span = soup.find("span", class_="price")
+        price_span = soup.select_one("span.price")
         price = float(price_span.text[1:].replace(",", "").strip()) if price_span else 0  # type: ignore
 
         # location
         latitude = None
         longitude = None
-        if soup.find("div", id="map"):
-            latitude = float(soup.find("div", id="map")["data-latitude"])  # type: ignore
-            longitude = float(soup.find("div", id="map")["data-longitude"])  # type: ignore
+        if map_div := soup.select_one("div#map"):
+            latitude = float(map_div["data-latitude"])  # type: ignore
+            longitude = float(map_div["data-longitude"])  # type: ignore
 
         # timestamps
-        postinginfos = soup.find("div", class_="postinginfos")
-        posted = postinginfos.find(lambda tag: "posted:" in tag.text and tag.find("time") is not None)  # type: ignore
-        creation_time = datetime.fromisoformat(posted.find("time")["datetime"]).astimezone(ZoneInfo("UTC"))  # type: ignore
-        updated = postinginfos.find(lambda tag: "updated:" in tag.text and tag.find("time") is not None)  # type: ignore
-        updated_time = creation_time
-        if updated:
-            updated_time = datetime.fromisoformat(updated.find("time")["datetime"]).astimezone(ZoneInfo("UTC"))  # type: ignore
+        creation_time = None
+        updated_time = None
+        postinginfos = soup.select_one("div.postinginfos")
+        for postinginfo in postinginfos.select("p.postinginfo"):  # type: ignore
+            if (time_tag := postinginfo.select_one("time")) is None:
+                continue
+            timestamp = datetime.fromisoformat(time_tag["datetime"]).astimezone(timezone.utc)  # type: ignore
+            postinginfo_text = postinginfo.text
+            if "posted:" in postinginfo_text:
+                creation_time = timestamp
+            elif "updated:" in postinginfo_text:
+                updated_time = timestamp
+        if creation_time is None:
+            raise ValueError("Couldn't find posted time")
 
         return CraigslistListing(
             url=url,
@@ -205,7 +322,7 @@ def _parse_result_details(url: str, content: str) -> CraigslistListing:
             latitude=latitude,
             longitude=longitude,
             creation_time=creation_time,
-            updated_time=updated_time,
+            updated_time=updated_time or creation_time,
         )
     except Exception as e:
         raise ParseError(f"Error parsing listing {url}", content) from e
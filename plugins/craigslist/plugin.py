@@ -2,19 +2,18 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Awaitable, Callable
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 import discord
 from discord.ui import Modal
 
 from hyacinth.models import DiscordMessage
-from hyacinth.notifier import ChannelNotifier
 from hyacinth.plugin import Plugin
 from hyacinth.settings import get_settings
-from plugins.craigslist.client import get_listings
-from plugins.craigslist.format import format_listing
 from plugins.craigslist.models import CraigslistListing, CraigslistSearchParams
-from plugins.craigslist.setup_modal import CraigslistSetupModal
+
+if TYPE_CHECKING:
+    from hyacinth.notifier import ChannelNotifier
 
 settings = get_settings()
 _logger = logging.getLogger(__name__)
@@ -35,11 +34,15 @@ class CraigslistPlugin(Plugin[CraigslistSearchParams, CraigslistListing]):
     async def get_listings(
         self, search_params: CraigslistSearchParams, after_time: datetime, limit: int | None = None
     ) -> list[CraigslistListing]:
+        from plugins.craigslist.client import get_listings
+
         return await get_listings(search_params, after_time, limit)
 
     def format_listing(
         self, notifier: ChannelNotifier, listing: CraigslistListing
     ) -> DiscordMessage:
+        from plugins.craigslist.format import format_listing
+
         return format_listing(notifier, listing)
 
     def get_setup_modal(
@@ -47,4 +50,6 @@ class CraigslistPlugin(Plugin[CraigslistSearchParams, CraigslistListing]):
         callback: Callable[[discord.Interaction, CraigslistSearchParams], Awaitable[None]],
         existing_search_params: CraigslistSearchParams | None = None,
     ) -> Modal:
+        from plugins.craigslist.setup_modal import CraigslistSetupModal
+
         return CraigslistSetupModal(callback, prefill=existing_search_params)
@@ -11,6 +11,7 @@ from plugins.craigslist.models import CraigslistSite
 
 _logger = logging.getLogger(__name__)
 AREAS_REFERENCE_JSON_PATH = Path(os.path.realpath(__file__)).parent / "craigslist_areas.json"
+_SITE_FROM_URL_RE = re.compile(r"http(s)?://(www\.)?(.+)\.craigslist")
 
 
 @cache
@@ -32,12 +33,9 @@ def get_areas_reference(
 
 
 def get_geotag_from_url(url: str) -> tuple[float, float]:
-    match = re.match(r"http(s)?://(www\.)?(.+)\.craigslist", url)
+    match = _SITE_FROM_URL_RE.match(url)
     if match is None:
         raise ValueError(url)
     site = match.groups()[2]
-    areas_reference = get_areas_reference()
-    return (
-        areas_reference[site].latitude,
-        areas_reference[site].longitude,
-    )
+    area = get_areas_reference()[site]
+    return area.latitude, area.longitude
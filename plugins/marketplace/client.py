@@ -3,7 +3,7 @@ import logging
 from datetime import datetime
 from typing import AsyncGenerator
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from playwright.async_api import Page, TimeoutError
 from zoneinfo import ZoneInfo
 
@@ -19,6 +19,8 @@ _logger = logging.getLogger(__name__)
 
 MARKETPLACE_SEARCH_URL = "https://www.facebook.com/marketplace/{location}/{category}/?sortBy=creation_time_descend&exact=false"
 
+_JSON_SCRIPT_STRAINER = SoupStrainer("script", attrs={"type": "application/json"})
+
 
 async def get_listings(
     search_params: MarketplaceSearchParams, after_time: datetime, limit: int | None = None
@@ -143,7 +145,8 @@ def _parse_result_details(url: str, content: str) -> MarketplaceListing:
     Parse Marketplace result details page.
     """
     try:
-        soup = BeautifulSoup(content, "html.parser")
+        # listing details are only read from embedded json scripts, so only those are parsed
+        soup = BeautifulSoup(content, "html.parser", parse_only=_JSON_SCRIPT_STRAINER)
         scripts = soup.find_all("script", attrs={"type": "application/json"})
         product_data_script = None
         listing_photos_script = None
@@ -2,19 +2,18 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Awaitable, Callable
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 import discord
 from discord.ui import Modal
 
 from hyacinth.models import DiscordMessage
-from hyacinth.notifier import ChannelNotifier
 from hyacinth.plugin import Plugin
 from hyacinth.settings import get_settings
-from plugins.marketplace.client import get_listings
-from plugins.marketplace.format import format_listing
 from plugins.marketplace.models import MarketplaceListing, MarketplaceSearchParams
-from plugins.marketplace.setup_modal import MarketplaceSetupModal
+
+if TYPE_CHECKING:
+    from hyacinth.notifier import ChannelNotifier
 
 settings = get_settings()
 _logger = logging.getLogger(__name__)
@@ -35,11 +34,15 @@ class MarketplacePlugin(Plugin[MarketplaceSearchParams, MarketplaceListing]):
     async def get_listings(
         self, search_params: MarketplaceSearchParams, after_time: datetime, limit: int | None = None
     ) -> list[MarketplaceListing]:
+        from plugins.marketplace.client import get_listings
+
         return await get_listings(search_params, after_time, limit)
 
     def format_listing(
         self, notifier: ChannelNotifier, listing: MarketplaceListing
     ) -> DiscordMessage:
+        from plugins.marketplace.format import format_listing
+
         return format_listing(notifier, listing)
 
     def get_setup_modal(
@@ -47,4 +50,6 @@ class MarketplacePlugin(Plugin[MarketplaceSearchParams, MarketplaceListing]):
         callback: Callable[[discord.Interaction, MarketplaceSearchParams], Awaitable[None]],
         existing_search_params: MarketplaceSearchParams | None = None,
     ) -> Modal:
+        from plugins.marketplace.setup_modal import MarketplaceSetupModal
+
         return MarketplaceSetupModal(callback, prefill=existing_search_params)
@@ -73,8 +73,16 @@ def get_categories() -> list[MarketplaceCategory]:
     return categories
 
 
+@cache
+def get_category_keys() -> frozenset[str]:
+    """
+    IDs and SEO URLs of all known categories, built once for fast membership checks.
+    """
+    return frozenset(key for c in get_categories() for key in (c.id, c.seo_url) if key is not None)
+
+
 def has_category(category: str) -> bool:
-    return any(c.id == category or c.seo_url == category for c in get_categories())
+    return category in get_category_keys()
 
 
 def find_json_key(
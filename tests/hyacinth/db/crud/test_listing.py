@@ -1,8 +1,15 @@
 from datetime import datetime
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, sessionmaker
 
-from hyacinth.db.crud.listing import get_last_listing, get_listings
+from hyacinth.db.crud.listing import (
+    add_listings,
+    get_last_seen_times,
+    get_listings,
+)
+from hyacinth.db.models import Listing
+from hyacinth.models import BaseListing
 from tests.sample_data import make_listing, make_search_spec
 
 
@@ -27,25 +34,55 @@ def test_get_listings__multiple_listings__returns_correctly_ordered_and_filtered
         ]
 
 
-def test_get_last_listing__multiple_listings__returns_most_recent_listing(
+def test_add_listings__multiple_listings__inserts_all_listings(
     test_db_session: sessionmaker[Session],
 ) -> None:
     some_search_spec = make_search_spec()
     some_listings = [
-        make_listing(search_spec=some_search_spec, creation_time=datetime(2023, 1, 4)),
-        make_listing(search_spec=some_search_spec, creation_time=datetime(2023, 1, 9)),
-        make_listing(search_spec=some_search_spec, creation_time=datetime(2023, 1, 1)),
+        BaseListing(creation_time=datetime(2023, 1, 1)),
+        BaseListing(creation_time=datetime(2023, 1, 2)),
     ]
+    with test_db_session() as session:
+        session.add(some_search_spec)
+        session.commit()
+
+        add_listings(session, some_search_spec.id, some_listings)
+        session.commit()
+
+        assert [
+            listing.creation_time
+            for listing in get_listings(session, some_search_spec.id, datetime.min)
+        ] == [datetime(2023, 1, 1), datetime(2023, 1, 2)]
+
 
+def test_add_listings__no_listings__inserts_nothing(
+    test_db_session: sessionmaker[Session],
+) -> None:
     with test_db_session() as session:
-        session.add_all(some_listings)
+        add_listings(session, 1, [])
         session.commit()
 
-        assert get_last_listing(session, some_search_spec.id) == some_listings[1]
+        assert session.scalar(select(func.count()).select_from(Listing)) == 0
 
 
-def test_get_last_listing__no_listings__returns_none(
+def test_get_last_seen_times__listings_for_multiple_search_specs__returns_latest_per_search_spec(
     test_db_session: sessionmaker[Session],
 ) -> None:
+    some_search_spec = make_search_spec()
+    some_other_search_spec = make_search_spec(search_params_json='{"other": true}')
+    some_listings = [
+        make_listing(search_spec=some_search_spec),
+        make_listing(search_spec=some_search_spec),
+        make_listing(search_spec=some_other_search_spec),
+    ]
+    some_listings[0].created_at = datetime(2023, 1, 4)
+    some_listings[1].created_at = datetime(2023, 1, 9)
+    some_listings[2].created_at = datetime(2023, 1, 1)
     with test_db_session() as session:
-        assert get_last_listing(session, 1) is None
+        session.add_all(some_listings)
+        session.commit()
+
+        assert get_last_seen_times(session) == {
+            some_search_spec.id: datetime(2023, 1, 9),
+            some_other_search_spec.id: datetime(2023, 1, 1),
+        }
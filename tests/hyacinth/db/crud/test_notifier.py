@@ -1,10 +1,12 @@
+import pytest
 from pytest_mock import MockerFixture
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session, sessionmaker
 
-from hyacinth.db.crud.notifier import get_channel_notifiers
-from hyacinth.db.models import ChannelNotifierState, NotifierSearch
-from tests.sample_data import make_channel_notifier_state, make_notifier_search
+from hyacinth.db.crud.notifier import get_channel_notifiers, save_notifier_state
+from hyacinth.db.models import ChannelNotifierState, Filter, NotifierSearch
+from hyacinth.notifier import ChannelNotifier
+from tests.sample_data import make_channel_notifier_state, make_filter, make_notifier_search
 
 SOME_CHANNEL_ID = 123
 SOME_OTHER_CHANNEL_ID = 456
@@ -13,16 +15,14 @@ SOME_OTHER_CHANNEL_ID = 456
 def test_get_channel_notifiers__some_channels_do_not_exist__deletes_notifiers_with_stale_channels(
     test_db_session: sessionmaker[Session], mock_notifier_scheduler: None, mocker: MockerFixture
 ) -> None:
-    mock_client = mocker.Mock(
-        get_channel=lambda channel_id: (
-            mocker.Mock(id=SOME_CHANNEL_ID) if channel_id == SOME_CHANNEL_ID else None
-        )
-    )
+    mock_client = mocker.Mock(get_all_channels=lambda: [mocker.Mock(id=SOME_CHANNEL_ID)])
     some_notifier_search = make_notifier_search()
     some_saved_states = [
         make_channel_notifier_state(channel_id=SOME_CHANNEL_ID),
         make_channel_notifier_state(
-            channel_id=SOME_OTHER_CHANNEL_ID, active_searches=[some_notifier_search]
+            channel_id=SOME_OTHER_CHANNEL_ID,
+            active_searches=[some_notifier_search],
+            filters=[make_filter()],
         ),
     ]
 
@@ -30,7 +30,7 @@ def test_get_channel_notifiers__some_channels_do_not_exist__deletes_notifiers_wi
         session.add_all(some_saved_states)
         session.commit()
 
-        notifiers = get_channel_notifiers(session, mock_client, mocker.Mock())
+        notifiers = list(get_channel_notifiers(session, mock_client, mocker.Mock()))
 
         assert len(notifiers) == 1
         assert notifiers[0].channel.id == SOME_CHANNEL_ID
@@ -39,5 +39,47 @@ def test_get_channel_notifiers__some_channels_do_not_exist__deletes_notifiers_wi
             SOME_CHANNEL_ID
         )
 
-        # verify related notifier search was also deleted
+        # verify related notifier search and filter were also deleted
         assert session.scalar(select(func.count()).select_from(NotifierSearch)) == 0
+        assert session.scalar(select(func.count()).select_from(Filter)) == 0
+
+
+def test_save_notifier_state__updated_config__persists_config(
+    test_db_session: sessionmaker[Session], mocker: MockerFixture
+) -> None:
+    with test_db_session() as session:
+        some_notifier_state = make_channel_notifier_state(channel_id=SOME_CHANNEL_ID)
+        session.add(some_notifier_state)
+        session.commit()
+
+        some_notifier = mocker.Mock(
+            spec=ChannelNotifier,
+            channel=mocker.Mock(id=SOME_CHANNEL_ID),
+            config=ChannelNotifier.Config(
+                id=some_notifier_state.id,
+                notification_frequency_seconds=30,
+                paused=True,
+                home_location=(1.0, 2.0),
+            ),
+        )
+        save_notifier_state(session, some_notifier)
+        session.commit()
+
+        session.refresh(some_notifier_state)
+        assert some_notifier_state.paused
+        assert some_notifier_state.notification_frequency_seconds == 30
+        assert some_notifier_state.home_latitude == 1.0
+        assert some_notifier_state.home_longitude == 2.0
+
+
+def test_save_notifier_state__no_saved_state__raises_value_error(
+    test_db_session: sessionmaker[Session], mocker: MockerFixture
+) -> None:
+    some_notifier = mocker.Mock(
+        spec=ChannelNotifier,
+        channel=mocker.Mock(id=SOME_CHANNEL_ID),
+        config=ChannelNotifier.Config(id=1),
+    )
+
+    with test_db_session() as session, pytest.raises(ValueError):
+        save_notifier_state(session, some_notifier)
@@ -1,28 +1,15 @@
-from datetime import datetime
-
 from pytest_mock import MockerFixture
 from sqlalchemy import select
 from sqlalchemy.orm import Session, sessionmaker
 
-from hyacinth.db.models import Filter, Listing, NotifierSearch, SearchSpec
-from hyacinth.models import BaseListing, BaseSearchParams
+from hyacinth.db.models import Filter, NotifierSearch, SearchSpec
+from hyacinth.models import BaseSearchParams
 from plugins.craigslist.plugin import CraigslistPlugin
 from tests.sample_data import make_channel_notifier_state, make_filter, make_notifier_search
 
 MODULE = "hyacinth.db.models"
 
 
-def test_listing_from_base_listing__some_listing_model__creates_expected_model() -> None:
-    class SomeListingModel(BaseListing):
-        title: str
-
-    base_listing = SomeListingModel(creation_time=datetime(2021, 1, 1), title="test title")
-    listing = Listing.from_base_listing(base_listing, 1)
-
-    assert listing.search_spec_id == 1
-    assert listing.listing_json == '{"creation_time":"2021-01-01T00:00:00","title":"test title"}'
-
-
 def test_search_spec_plugin_property__some_plugin_path__loads_expected_plugin(
     load_plugins: None,
 ) -> None:
@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+
+import pytest
+from pytest_mock import MockerFixture
+
+from hyacinth import monitor as monitor_module
+from hyacinth.models import BaseListing
+from hyacinth.monitor import SearchMonitor
+
+MODULE = "hyacinth.monitor"
+
+SOME_AFTER_TIME = datetime(2023, 1, 1)
+SOME_SAVED_AT = datetime(2023, 1, 2, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def monitor(mocker: MockerFixture) -> SearchMonitor:
+    mocker.patch(f"{MODULE}.get_async_scheduler")
+    mocker.patch(f"{MODULE}.Session")
+    mocker.patch(f"{MODULE}.IntervalTrigger")
+    mocker.patch(f"{MODULE}.get_last_seen_times_from_db", return_value={})
+    return SearchMonitor()
+
+
+async def test_get_listings__same_search_and_after_time__queries_db_once(
+    monitor: SearchMonitor, mocker: MockerFixture
+) -> None:
+    mock_get_listings_from_db = mocker.patch(f"{MODULE}.get_listings_from_db")
+    some_search_spec = mocker.Mock(id=1)
+    monitor.register_search(some_search_spec)
+
+    first = await monitor.get_listings(some_search_spec, SOME_AFTER_TIME)
+    second = await monitor.get_listings(some_search_spec, SOME_AFTER_TIME)
+
+    assert first is second
+    mock_get_listings_from_db.assert_called_once()
+
+
+async def test_get_listings__search_polled_with_new_listings__queries_db_again(
+    monitor: SearchMonitor, mocker: MockerFixture
+) -> None:
+    mock_get_listings_from_db = mocker.patch(f"{MODULE}.get_listings_from_db")
+    mocker.patch(f"{MODULE}.add_listings", return_value=SOME_SAVED_AT)
+    some_search_spec = mocker.Mock(id=1)
+    mocker.patch.object(
+        monitor,
+        "_SearchMonitor__safe_poll_search",
+        return_value=[BaseListing(creation_time=SOME_AFTER_TIME)],
+    )
+    monitor.register_search(some_search_spec)
+
+    await monitor.get_listings(some_search_spec, SOME_AFTER_TIME)
+    await monitor.poll_search(some_search_spec)
+    await monitor.get_listings(some_search_spec, SOME_AFTER_TIME)
+
+    assert mock_get_listings_from_db.call_count == 2
+
+
+def test_register_search__search_polling_disabled__does_not_schedule_job(
+    monitor: SearchMonitor, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(monitor_module.settings, "disable_search_polling", True)
+    some_search_spec = mocker.Mock(id=1)
+
+    monitor.register_search(some_search_spec)
+    monitor.remove_search(some_search_spec)
+
+    monitor.scheduler.add_job.assert_not_called()  # type: ignore[attr-defined]
+    monitor.scheduler.remove_job.assert_not_called()  # type: ignore[attr-defined]
+
+
+def test_remove_search__search_registered_twice__removes_job_after_last_reference(
+    monitor: SearchMonitor, mocker: MockerFixture
+) -> None:
+    some_search_spec = mocker.Mock(id=1)
+    monitor.register_search(some_search_spec)
+    monitor.register_search(some_search_spec)
+
+    monitor.remove_search(some_search_spec)
+    monitor.scheduler.remove_job.assert_not_called()  # type: ignore[attr-defined]
+
+    monitor.remove_search(some_search_spec)
+    monitor.scheduler.add_job.assert_called_once()  # type: ignore[attr-defined]
+    monitor.scheduler.remove_job.assert_called_once()  # type: ignore[attr-defined]
+    assert some_search_spec.id not in monitor.search_jobs
+
+
+async def test_poll_search__previous_poll_saved_listings__resumes_at_last_saved_time(
+    monitor: SearchMonitor, mocker: MockerFixture
+) -> None:
+    some_saved_at = datetime.now(timezone.utc)
+    mocker.patch(f"{MODULE}.add_listings", return_value=some_saved_at)
+    mock_safe_poll_search = mocker.patch.object(
+        monitor,
+        "_SearchMonitor__safe_poll_search",
+        return_value=[BaseListing(creation_time=some_saved_at)],
+    )
+    some_search_spec = mocker.Mock(id=1)
+
+    await monitor.poll_search(some_search_spec)
+    await monitor.poll_search(some_search_spec)
+
+    assert mock_safe_poll_search.call_args_list[0].args[1] < some_saved_at
+    assert mock_safe_poll_search.call_args_list[1].args[1] == some_saved_at
@@ -1,6 +1,23 @@
-from typing import Callable
+from typing import Callable, Generator
+
+import pytest
+from pytest_mock import MockerFixture
 
 from hyacinth.models import Location
+from hyacinth.util.geo import _reverse_geotag_cached, reverse_geotag
+
+MODULE = "hyacinth.util.geo"
+
+
+@pytest.fixture
+def clear_reverse_geotag_cache() -> Generator[None, None, None]:
+    """
+    Clear the reverse geotag cache before and after use, so cached locations don't leak between
+    tests.
+    """
+    _reverse_geotag_cached.cache_clear()
+    yield
+    _reverse_geotag_cached.cache_clear()
 
 
 def test_reverse_geocode__reversable_geotag(
@@ -29,3 +46,27 @@ def test_reverse_geocode__middle_of_the_ocean(
     geotag = (39.80490085251606, -39.47329574577306)  # atlantic ocean
     location = reverse_geocode_function(geotag)
     assert location == Location(city=None, state=None, latitude=geotag[0], longitude=geotag[1])
+
+
+def test_reverse_geotag__nearby_geotags__looks_up_location_once(
+    mocker: MockerFixture, clear_reverse_geotag_cache: None
+) -> None:
+    mocker.patch(f"{MODULE}.settings.use_local_geocoder", True)
+    reverse_geotag_local_mock = mocker.patch(
+        f"{MODULE}._reverse_geotag_local",
+        side_effect=lambda geotag: Location(
+            city="Boston", state="Massachusetts", latitude=geotag[0], longitude=geotag[1]
+        ),
+    )
+
+    location_one = reverse_geotag((42.36052144409481, -71.05801368957714))
+    location_two = reverse_geotag((42.36071, -71.05788))
+
+    reverse_geotag_local_mock.assert_called_once()
+    assert location_one.city == location_two.city == "Boston"
+    # the original coordinates are kept, rather than the rounded ones used for the lookup
+    assert (location_one.latitude, location_one.longitude) == (
+        42.36052144409481,
+        -71.05801368957714,
+    )
+    assert (location_two.latitude, location_two.longitude) == (42.36071, -71.05788)
@@ -0,0 +1,87 @@
+import time
+from typing import AsyncIterator
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from hyacinth.util.scraping import close_browser_context, get_browser_context
+
+MODULE = "hyacinth.util.scraping"
+
+
+@pytest.fixture
+async def browser_mocks(mocker: MockerFixture) -> AsyncIterator[list[AsyncMock]]:
+    """
+    Mock the browser connection. Each connection made is appended to the yielded list.
+    """
+    browser_mocks: list[AsyncMock] = []
+
+    def connect_over_cdp(_: str) -> AsyncMock:
+        browser_mock = mocker.AsyncMock()
+        browser_mock.is_connected = mocker.Mock(return_value=True)
+        browser_mock.new_context.side_effect = lambda: mocker.AsyncMock()
+        browser_mocks.append(browser_mock)
+        return browser_mock
+
+    playwright_mock = mocker.AsyncMock()
+    playwright_mock.chromium.connect_over_cdp.side_effect = connect_over_cdp
+    mocker.patch(f"{MODULE}.async_playwright").return_value.start = mocker.AsyncMock(
+        return_value=playwright_mock
+    )
+    yield browser_mocks
+    await close_browser_context()
+
+
+async def test_get_browser_context__called_twice__connects_once_with_separate_contexts(
+    browser_mocks: list[AsyncMock],
+) -> None:
+    async with get_browser_context() as first_context:
+        pass
+    async with get_browser_context() as second_context:
+        pass
+
+    assert len(browser_mocks) == 1
+    assert first_context is not second_context
+    first_context.close.assert_awaited_once()  # type: ignore
+    second_context.close.assert_awaited_once()  # type: ignore
+
+
+async def test_get_browser_context__caller_raises__closes_context(
+    browser_mocks: list[AsyncMock],
+) -> None:
+    with pytest.raises(RuntimeError):
+        async with get_browser_context() as context:
+            raise RuntimeError("some error")
+
+    context.close.assert_awaited_once()  # type: ignore
+
+
+async def test_get_browser_context__browser_disconnected__reconnects(
+    browser_mocks: list[AsyncMock],
+) -> None:
+    async with get_browser_context():
+        pass
+    browser_mocks[0].is_connected.return_value = False
+    async with get_browser_context():
+        pass
+
+    assert len(browser_mocks) == 2
+
+
+async def test_get_browser_context__connection_reaches_max_age__reconnects_and_closes_old_when_unused(
+    browser_mocks: list[AsyncMock], mocker: MockerFixture
+) -> None:
+    mocker.patch(f"{MODULE}.settings.browser_connection_max_age_seconds", 60)
+
+    async with get_browser_context():
+        mocker.patch(f"{MODULE}._browser_connected_at", time.monotonic() - 61)
+        async with get_browser_context():
+            pass
+
+        assert len(browser_mocks) == 2
+        # the old connection is still in use by the outer search
+        browser_mocks[0].close.assert_not_awaited()
+
+    browser_mocks[0].close.assert_awaited_once()
+    browser_mocks[1].close.assert_not_awaited()
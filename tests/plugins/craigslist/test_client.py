@@ -1,7 +1,22 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import AsyncGenerator
+
+import pytest
+from playwright.async_api import Page, TimeoutError
 from pytest_mock import MockerFixture
 
-from plugins.craigslist.client import _parse_result_details, _parse_search_results, _search
-from plugins.craigslist.models import CraigslistSearchParams
+from hyacinth.exceptions import ParseError
+from hyacinth.models import Location
+from plugins.craigslist.client import (
+    _enrich_listings,
+    _get_search_results_content,
+    _parse_result_details,
+    _parse_search_results,
+    _search,
+    get_listings,
+)
+from plugins.craigslist.models import CraigslistListing, CraigslistSearchParams
 
 MODULE = "plugins.craigslist.client"
 
@@ -28,6 +43,17 @@ def test__parse_search_results__sample_last_page_search_results__returns_no_next
     assert not has_next_page
 
 
+def test__parse_search_results__last_page_with_thousands_separator__returns_no_next_page() -> None:
+    content = """
+        <div class="cl-results-page"><li><a class="main" href="https://boston.craigslist.org/a.html"></a></li></div>
+        <span class="cl-page-number">9,881 - 10,000 of 10,000</span>
+    """
+
+    has_next_page, _ = _parse_search_results(content)
+
+    assert not has_next_page
+
+
 def test__parse_result_details__sample_result_details__returns_updated() -> None:
     with open("tests/resources/craigslist-result-details-sample.html") as f:
         content = f.read()
@@ -69,7 +95,6 @@ async def test__search__mocked_content__returns_all_listings_on_page_and_follows
     mocker: MockerFixture,
 ) -> None:
     mocker.patch(f"{MODULE}.get_browser_context")
-    mocker.patch(f"{MODULE}._enrich_listing")
     mocker.patch(
         f"{MODULE}._parse_search_results",
         side_effect=[(True, ["some-url-1", "some-url-2"]), (False, ["some-url-3"])],
@@ -86,3 +111,141 @@ async def test__search__mocked_content__returns_all_listings_on_page_and_follows
         "listing for some-url-2",
         "listing for some-url-3",
     ]
+
+
+async def test__search__details_finish_out_of_order_and_closed_early__yields_in_order_and_cancels_fetches(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch(f"{MODULE}.get_browser_context")
+    mocker.patch(f"{MODULE}._get_search_results_content")
+    parse_search_results_mock = mocker.patch(
+        f"{MODULE}._parse_search_results",
+        return_value=(True, ["some-url-1", "some-url-2", "some-url-3", "some-url-4"]),
+    )
+    mocker.patch(f"{MODULE}._parse_result_details", side_effect=lambda url, _: f"listing for {url}")
+    fetched_urls = []
+    some_url_2_released = asyncio.Event()
+    some_url_4_cancelled = asyncio.Event()
+
+    async def get_detail_content(_: Page, url: str) -> str:
+        fetched_urls.append(url)
+        if url == "some-url-2":
+            await some_url_2_released.wait()
+        elif url == "some-url-3":
+            some_url_2_released.set()
+        elif url == "some-url-4":
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                # cleanup that outlives the cancellation must still finish before the search closes
+                await asyncio.sleep(0.01)
+                some_url_4_cancelled.set()
+                raise
+        return url
+
+    mocker.patch(f"{MODULE}._get_detail_content", side_effect=get_detail_content)
+
+    search = _search(CraigslistSearchParams(site="boston", category="sss"))
+    first_listing = await anext(search)
+    # only the first listing is fetched until the caller asks for more
+    assert fetched_urls == ["some-url-1"]
+    second_listing = await anext(search)
+    await search.aclose()
+
+    assert first_listing == "listing for some-url-1"
+    assert second_listing == "listing for some-url-2"
+    assert some_url_4_cancelled.is_set()
+    # the next page of search results isn't loaded until this page has been consumed
+    parse_search_results_mock.assert_called_once()
+
+
+async def test_get_listings__listings_older_than_after_time__enriches_only_newer_listings(
+    mocker: MockerFixture,
+) -> None:
+    some_listings = [
+        make_craigslist_listing(creation_time=datetime(2023, 1, day, tzinfo=timezone.utc))
+        for day in (9, 8, 3, 2)
+    ]
+
+    async def search(_: CraigslistSearchParams) -> AsyncGenerator[CraigslistListing, None]:
+        for listing in some_listings:
+            yield listing
+
+    mocker.patch(f"{MODULE}._search", side_effect=search)
+    enrich_listings_mock = mocker.patch(f"{MODULE}._enrich_listings")
+
+    listings = await get_listings(
+        CraigslistSearchParams(site="boston", category="sss"),
+        after_time=datetime(2023, 1, 4, tzinfo=timezone.utc),
+    )
+
+    assert listings == some_listings[:2]
+    enrich_listings_mock.assert_awaited_once_with(some_listings[:2])
+
+
+async def test__enrich_listings__many_thumbnails__mirrors_at_most_concurrency_limit_at_once(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch(f"{MODULE}._MIRROR_THUMBNAILS", True)
+    mocker.patch(f"{MODULE}.settings.s3_thumbnail_mirror_concurrency", 2)
+    mocker.patch(
+        f"{MODULE}.reverse_geotag",
+        side_effect=lambda geotag: Location(
+            city="Boston", state="Massachusetts", latitude=geotag[0], longitude=geotag[1]
+        ),
+    )
+    mirrors_in_progress = 0
+    max_mirrors_in_progress = 0
+
+    async def mirror_image(url: str) -> str:
+        nonlocal mirrors_in_progress, max_mirrors_in_progress
+        mirrors_in_progress += 1
+        max_mirrors_in_progress = max(max_mirrors_in_progress, mirrors_in_progress)
+        await asyncio.sleep(0.01)
+        mirrors_in_progress -= 1
+        return f"mirror of {url}"
+
+    mocker.patch(f"{MODULE}.mirror_image", side_effect=mirror_image)
+    some_listings = [
+        make_craigslist_listing(thumbnail_url=f"some-thumbnail-url-{i}") for i in range(5)
+    ]
+
+    await _enrich_listings(some_listings)
+
+    assert max_mirrors_in_progress == 2
+    assert [listing.thumbnail_url for listing in some_listings] == [
+        f"mirror of some-thumbnail-url-{i}" for i in range(5)
+    ]
+    assert all(listing.city == "Boston" for listing in some_listings)
+
+
+def make_craigslist_listing(
+    creation_time: datetime = datetime(2023, 1, 1, tzinfo=timezone.utc),
+    thumbnail_url: str | None = None,
+) -> CraigslistListing:
+    return CraigslistListing(
+        title="some listing",
+        url="some-url",
+        body="",
+        image_urls=[],
+        thumbnail_url=thumbnail_url,
+        price=0,
+        city=None,
+        state=None,
+        latitude=42.36052,
+        longitude=-71.05801,
+        creation_time=creation_time,
+        updated_time=creation_time,
+    )
+
+
+async def test__get_search_results_content__results_never_render__raises_parse_error(
+    mocker: MockerFixture,
+) -> None:
+    browser_page = mocker.AsyncMock(spec=Page)
+    browser_page.wait_for_selector.side_effect = TimeoutError("Timeout 5000ms exceeded.")
+
+    with pytest.raises(ParseError):
+        await _get_search_results_content(
+            browser_page, "https://boston.craigslist.org/search/sss#search=1~gallery~0~0"
+        )
@@ -1,4 +1,4 @@
-from plugins.marketplace.util import get_categories
+from plugins.marketplace.util import get_categories, has_category
 
 
 def test_get_categories__with_file_present__returns_categories() -> None:
@@ -6,3 +6,11 @@ def test_get_categories__with_file_present__returns_categories() -> None:
     categories = get_categories()
 
     assert len(categories) > 1000
+
+
+def test_has_category__known_id_and_seo_url__returns_true() -> None:
+    category = next(c for c in get_categories() if c.seo_url is not None)
+
+    assert has_category(category.id)
+    assert has_category(category.seo_url)  # type: ignore[arg-type]
+    assert not has_category("not-a-real-category")